@@ -1,4 +1,5 @@
 import os
+import random
 import sys
 from multiprocessing import Process
 from pathlib import Path
@@ -138,3 +139,60 @@ def modified_clock(_the_snake):
     _the_snake.clock = modified_clock_obj
     yield
     _the_snake.clock = original_clock
+
+
+def assert_free_cells_consistent(the_snake, snake):
+    body = set(snake.positions)
+    expected = set(range(the_snake.CELL_COUNT)) - body
+    assert set(snake.free_cells) == expected, (
+        'Список `free_cells` должен содержать ровно те ячейки, которые не '
+        'заняты змейкой.'
+    )
+    assert len(snake.free_cells) == len(expected), (
+        'В списке `free_cells` не должно быть повторяющихся ячеек.'
+    )
+    for cell in snake.free_cells:
+        assert snake.free_cells[snake.free_index[cell]] == cell, (
+            f'Индекс свободной ячейки `{cell}` в `free_index` указывает '
+            'на другую ячейку списка `free_cells`.'
+        )
+
+
+def random_walk(the_snake, snake, steps, seed, grow_every=3):
+    """Двигает змейку случайно, не допуская столкновений с собой."""
+    rng = random.Random(seed)
+    directions = (the_snake.UP, the_snake.DOWN,
+                  the_snake.LEFT, the_snake.RIGHT)
+    for step in range(steps):
+        if step % grow_every == 0:
+            snake.length += 1
+        head = snake.positions[0]
+        body = list(snake.positions)
+        # Хвост освобождает ячейку, только если змейка не растёт
+        if len(body) >= snake.length:
+            body.pop()
+        options = [
+            direction for direction in directions
+            if (snake.direction, direction) not in the_snake.BLOCKED_PAIRS
+            and the_snake.NEXT_CELL[direction][head] not in body
+        ]
+        if not options:
+            # Змейка заперта собственным телом: начинаем заново, чтобы
+            # пройти все запрошенные шаги
+            snake.reset()
+            yield
+            continue
+        snake.update_direction(rng.choice(options))
+        snake.move()
+        assert not snake.collided
+        yield
+
+
+def assert_occupied_matches_positions(the_snake, snake):
+    body = set(snake.positions)
+    expected = bytearray(
+        1 if cell in body else 0 for cell in range(the_snake.CELL_COUNT)
+    )
+    assert snake.occupied == expected, (
+        'Сетка занятости `occupied` должна совпадать с ячейками `positions`.'
+    )
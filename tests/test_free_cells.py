@@ -0,0 +1,43 @@
+import pytest
+
+from conftest import assert_free_cells_consistent, random_walk
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_free_cells_after_move_and_grow(_the_snake, snake, seed):
+    assert_free_cells_consistent(_the_snake, snake)
+    max_length = 0
+    for _ in random_walk(_the_snake, snake, 300, seed):
+        assert_free_cells_consistent(_the_snake, snake)
+        max_length = max(max_length, len(snake.positions))
+    assert max_length >= 20, 'Змейка должна успеть вырасти за время обхода.'
+
+
+def test_free_cells_after_reset(_the_snake, snake):
+    for _ in random_walk(_the_snake, snake, 100, seed=0):
+        pass
+    snake.reset()
+    assert list(snake.positions) == [snake.cell]
+    assert_free_cells_consistent(_the_snake, snake)
+
+
+def test_apple_never_placed_on_snake(_the_snake, snake, apple):
+    for _ in random_walk(_the_snake, snake, 300, seed=1, grow_every=1):
+        body = set(snake.positions)
+        for _ in range(20):
+            apple.randomize_position(snake.free_cells)
+            assert apple.cell not in body, (
+                'Метод `randomize_position` не должен помещать яблоко на '
+                'змейку.'
+            )
+            assert apple.position == _the_snake.CELL_POSITION[apple.cell]
+
+
+def test_apple_default_uses_whole_board(_the_snake, apple):
+    apple.randomize_position()
+    assert 0 <= apple.cell < _the_snake.CELL_COUNT
+
+
+def test_apple_on_full_board_raises(apple):
+    with pytest.raises(ValueError):
+        apple.randomize_position([])
@@ -0,0 +1,42 @@
+import pytest
+
+from conftest import assert_occupied_matches_positions, random_walk
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_occupied_matches_positions(_the_snake, snake, seed):
+    assert_occupied_matches_positions(_the_snake, snake)
+    for _ in random_walk(_the_snake, snake, 300, seed):
+        assert_occupied_matches_positions(_the_snake, snake)
+    snake.reset()
+    assert_occupied_matches_positions(_the_snake, snake)
+
+
+def move_in_square(the_snake, snake, length):
+    """Проводит змейку по квадрату 2x2 и возвращает голову в начало."""
+    start = snake.positions[0]
+    snake.length = length
+    for direction in (the_snake.RIGHT, the_snake.DOWN, the_snake.LEFT):
+        snake.update_direction(direction)
+        snake.move()
+        assert not snake.collided
+    snake.update_direction(the_snake.UP)
+    snake.move()
+    assert snake.positions[0] == start
+
+
+def test_head_may_enter_cell_left_by_tail(_the_snake, snake):
+    move_in_square(_the_snake, snake, length=4)
+    assert not snake.collided, (
+        'Ячейка, которую в этот же ход освобождает хвост, не должна '
+        'считаться столкновением.'
+    )
+    assert_occupied_matches_positions(_the_snake, snake)
+
+
+def test_collision_with_body(_the_snake, snake):
+    move_in_square(_the_snake, snake, length=5)
+    assert snake.collided, (
+        'Атрибут `collided` должен устанавливаться, когда голова змейки '
+        'попадает в её тело.'
+    )
@@ -0,0 +1,32 @@
+import pytest
+
+
+@pytest.mark.parametrize(
+    'class_name, position, expected_position',
+    (
+        ('GameObject', (5, 5), (0, 0)),
+        ('Apple', (700, 0), None),
+        ('Snake', (5, 5), (0, 0)),
+        ('Snake', (-20, 490), (620, 0)),
+    ),
+)
+def test_objects_accept_off_grid_positions(_the_snake, class_name, position,
+                                           expected_position):
+    try:
+        game_object = getattr(_the_snake, class_name)(position=position)
+    except Exception as error:
+        raise AssertionError(
+            f'При создании объекта `{class_name}` с позицией `{position}` '
+            f'возникло исключение: `{type(error).__name__}: {error}`'
+        )
+    assert game_object.position in _the_snake.CELL_POSITION
+    if expected_position is not None:
+        assert game_object.position == expected_position
+
+
+def test_position_assignment_moves_object(_the_snake, apple):
+    apple.position = (0, 0)
+    assert apple.cell == 0
+    assert apple.draw() == _the_snake.CELL_RECT[0], (
+        'Яблоко должно отрисовываться в ячейке, присвоенной через `position`.'
+    )
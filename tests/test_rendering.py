@@ -0,0 +1,90 @@
+import random
+
+import pygame as pg
+import pytest
+
+from conftest import StopInfiniteLoop
+
+FRAMES = 1500
+
+
+def expected_colors(the_snake, snake, apple):
+    colors = [the_snake.BOARD_BACKGROUND_COLOR] * the_snake.CELL_COUNT
+    colors[apple.cell] = the_snake.APPLE_COLOR
+    for cell in snake.positions:
+        colors[cell] = the_snake.SNAKE_COLOR
+    return colors
+
+
+def assert_screen_matches(the_snake, snake, apple, frame):
+    colors = expected_colors(the_snake, snake, apple)
+    # Середина ячейки, чтобы не попасть на рамку
+    offset = the_snake.GRID_SIZE // 2
+    for cell, (x, y) in enumerate(the_snake.CELL_POSITION):
+        color = tuple(the_snake.screen.get_at((x + offset, y + offset)))[:3]
+        assert color == colors[cell], (
+            f'Кадр {frame}: ячейка {(x, y)} отрисована цветом {color}, '
+            f'ожидался {colors[cell]}.'
+        )
+
+
+def steer_to_apple(the_snake, snake, apple, rng):
+    """Выбирает направление к яблоку, по возможности не врезаясь в себя."""
+    head = snake.positions[0]
+    apple_x, apple_y = apple.position
+    body = set(snake.positions)
+    options = []
+    for key, direction in the_snake.KEY_DIRECTION.items():
+        cell = the_snake.NEXT_CELL[direction][head]
+        x, y = the_snake.CELL_POSITION[cell]
+        distance = abs(x - apple_x) + abs(y - apple_y)
+        penalty = 10_000 if cell in body else 0
+        options.append((distance + penalty + rng.random() * 100, key))
+    return min(options)[1]
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_screen_matches_game_state(_the_snake, monkeypatch, seed):
+    rng = random.Random(seed)
+    monkeypatch.setattr(_the_snake, 'choice', rng.choice)
+    objects = {}
+    stats = {'frame': 0, 'resets': 0, 'max_length': 0}
+
+    class RecordingSnake(_the_snake.Snake):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            objects['snake'] = self
+
+        def reset(self):
+            if 'snake' in objects:
+                stats['resets'] += 1
+            super().reset()
+
+    class RecordingApple(_the_snake.Apple):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            objects['apple'] = self
+
+    class CheckingClock:
+        def tick(self, *args, **kwargs):
+            snake, apple = objects['snake'], objects['apple']
+            assert_screen_matches(_the_snake, snake, apple, stats['frame'])
+            stats['max_length'] = max(stats['max_length'],
+                                      len(snake.positions))
+            stats['frame'] += 1
+            if stats['frame'] > FRAMES:
+                raise StopInfiniteLoop
+            pg.event.post(pg.event.Event(
+                pg.KEYDOWN, key=steer_to_apple(_the_snake, snake, apple, rng)
+            ))
+            return 0
+
+    monkeypatch.setattr(_the_snake, 'Snake', RecordingSnake)
+    monkeypatch.setattr(_the_snake, 'Apple', RecordingApple)
+    monkeypatch.setattr(_the_snake, 'clock', CheckingClock())
+
+    with pytest.raises(StopInfiniteLoop):
+        _the_snake.main()
+
+    assert stats['resets'] > 0, 'За время проверки змейка должна погибнуть.'
+    assert stats['max_length'] >= 10, 'За время проверки змейка должна вырасти.'
@@ -1,4 +1,5 @@
-from random import randint
+from collections import deque
+from random import choice
 
 import pygame as pg
 
@@ -8,12 +9,46 @@ GRID_SIZE = 20
 GRID_WIDTH = SCREEN_WIDTH // GRID_SIZE
 GRID_HEIGHT = SCREEN_HEIGHT // GRID_SIZE
 
+# Количество ячеек игрового поля:
+CELL_COUNT = GRID_WIDTH * GRID_HEIGHT
+
+# Ячейки нумеруются целыми числами: номер = y * GRID_WIDTH + x.
+# Экранные координаты ячейки по её номеру:
+CELL_POSITION = tuple(
+    (cell % GRID_WIDTH * GRID_SIZE, cell // GRID_WIDTH * GRID_SIZE)
+    for cell in range(CELL_COUNT)
+)
+
+# Заранее созданные прямоугольники для каждой ячейки поля:
+CELL_RECT = tuple(
+    pg.Rect(position, (GRID_SIZE, GRID_SIZE)) for position in CELL_POSITION
+)
+
 # Направления движения:
 UP = (0, -1)
 DOWN = (0, 1)
 LEFT = (-1, 0)
 RIGHT = (1, 0)
 
+# Соответствие клавиш направлениям движения:
+KEY_DIRECTION = {
+    pg.K_UP: UP,
+    pg.K_DOWN: DOWN,
+    pg.K_LEFT: LEFT,
+    pg.K_RIGHT: RIGHT
+}
+
+# Типы событий, которые обрабатывает игра:
+HANDLED_EVENTS = (pg.QUIT, pg.KEYDOWN)
+
+# Запрещённые смены направления (разворот на месте):
+BLOCKED_PAIRS = frozenset({
+    (UP, DOWN),
+    (DOWN, UP),
+    (LEFT, RIGHT),
+    (RIGHT, LEFT)
+})
+
 # Цвет фона - черный:
 BOARD_BACKGROUND_COLOR = (0, 0, 0)
 
@@ -39,6 +74,86 @@ pg.display.set_caption('Змейка')
 clock = pg.time.Clock()
 
 
+def make_tile(color, border=True):
+    """Создаёт поверхность ячейки с заранее отрисованной заливкой и рамкой.
+
+    Args:
+        color (tuple): Цвет заливки ячейки в формате RGB
+        border (bool): Нужно ли рисовать рамку ячейки
+
+    Returns:
+        pg.Surface: Готовая к выводу через blit ячейка
+    """
+    tile = pg.Surface((GRID_SIZE, GRID_SIZE))
+    tile.fill(color)
+    if border:
+        pg.draw.rect(tile, BORDER_COLOR, tile.get_rect(), 1)
+    return tile
+
+
+# Ячейка для затирания следа змейки:
+ERASE_TILE = make_tile(BOARD_BACKGROUND_COLOR, border=False)
+
+
+def cell_index(position):
+    """Вычисляет номер ячейки, в которую попадают экранные координаты.
+
+    Координаты за пределами поля переносятся на поле так же, как это
+    происходит при движении змейки через край.
+
+    Args:
+        position (tuple): Экранные координаты (x, y)
+
+    Returns:
+        int: Номер ячейки
+    """
+    x, y = position
+    return (
+        y // GRID_SIZE % GRID_HEIGHT * GRID_WIDTH
+        + x // GRID_SIZE % GRID_WIDTH
+    )
+
+
+def neighbour_cell(cell, direction):
+    """Вычисляет соседнюю ячейку с учётом перехода через край поля.
+
+    Args:
+        cell (int): Номер исходной ячейки
+        direction (tuple): Направление сдвига
+
+    Returns:
+        int: Номер соседней ячейки
+    """
+    y, x = divmod(cell, GRID_WIDTH)
+    dir_x, dir_y = direction
+
+    # Сдвиг всегда на одну ячейку, поэтому для перехода через край
+    # поля достаточно сравнения вместо взятия остатка от деления
+    x += dir_x
+    if x < 0:
+        x = GRID_WIDTH - 1
+    elif x >= GRID_WIDTH:
+        x = 0
+
+    y += dir_y
+    if y < 0:
+        y = GRID_HEIGHT - 1
+    elif y >= GRID_HEIGHT:
+        y = 0
+
+    return y * GRID_WIDTH + x
+
+
+# Таблица переходов: номер следующей ячейки для каждого направления.
+# Вся арифметика движения выполняется один раз при загрузке модуля.
+NEXT_CELL = {
+    direction: tuple(
+        neighbour_cell(cell, direction) for cell in range(CELL_COUNT)
+    )
+    for direction in (UP, DOWN, LEFT, RIGHT)
+}
+
+
 class GameObject:
     """Базовый класс для всех игровых объектов."""
 
@@ -53,56 +168,105 @@ class GameObject:
             SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
         )
         self.body_color = body_color
+        # Ячейка отрисовывается один раз и затем только копируется на экран
+        self.tile = make_tile(body_color) if body_color else None
+
+    @property
+    def position(self):
+        """Экранные координаты объекта (x, y).
+
+        Единственное хранимое состояние - номер ячейки self.cell: сравнение
+        и хеширование целого числа дешевле кортежа. Присвоенные координаты
+        приводятся к ячейке, в которую они попадают.
+        """
+        return CELL_POSITION[self.cell]
+
+    @position.setter
+    def position(self, position):
+        self.cell = cell_index(position)
 
     def draw(self):
         """Абстрактный метод для отрисовки объекта."""
         raise NotImplementedError(
         )
 
-    def draw_cell(self, position=None):
-        """Отрисовывает ячейку на игровом поле."""
-        if position is None:
-            position = self.position
+    def draw_cell(self, cell=None):
+        """Отрисовывает ячейку на игровом поле.
+
+        Args:
+            cell (int): Номер ячейки, по умолчанию - ячейка объекта
+
+        Returns:
+            pg.Rect: Область экрана, которую затронула отрисовка
+        """
+        if cell is None:
+            cell = self.cell
+
+        rect = CELL_RECT[cell]
+        screen.blit(self.tile, rect)
+        return rect
+
+    def erase_cell(self, cell=None):
+        """Затирает ячейку на игровом поле цветом фона.
+
+        Args:
+            cell (int): Номер ячейки, по умолчанию - ячейка объекта
+
+        Returns:
+            pg.Rect: Область экрана, которую затронула отрисовка
+        """
+        if cell is None:
+            cell = self.cell
 
-        rect = pg.Rect(position, (GRID_SIZE, GRID_SIZE))
-        pg.draw.rect(screen, self.body_color, rect)
-        pg.draw.rect(screen, BORDER_COLOR, rect, 1)
+        rect = CELL_RECT[cell]
+        screen.blit(ERASE_TILE, rect)
+        return rect
 
 
 class Apple(GameObject):
     """Класс для представления яблока в игре."""
 
     def __init__(self, position=None, body_color=APPLE_COLOR,
-                 occupied_positions=None):
+                 free_cells=None):
         """Инициализирует яблоко со случайной позицией и красным цветом."""
         super().__init__(position, body_color)
-        self.randomize_position(occupied_positions)
+        self.randomize_position(free_cells)
 
-    def randomize_position(self, occupied_positions=None):
+    def randomize_position(self, free_cells=None):
         """Устанавливает случайную позицию для яблока на игровом поле.
 
+        Вместо повторных попыток до попадания в свободную ячейку позиция
+        выбирается за один раз из списка свободных ячеек.
+
         Args:
-            occupied_positions (list): Список занятых позиций, которые нужно
-                                       избегать
+            free_cells (list): Список номеров свободных ячеек, по умолчанию -
+                               все ячейки поля
+
+        Raises:
+            ValueError: Если свободных ячеек не осталось
         """
-        while True:
-            self.position = (
-                randint(0, GRID_WIDTH - 1) * GRID_SIZE,
-                randint(0, GRID_HEIGHT - 1) * GRID_SIZE
-            )
+        if free_cells is None:
+            free_cells = range(CELL_COUNT)
+        elif not free_cells:
+            raise ValueError('Нет свободных ячеек: поле заполнено змейкой.')
 
-            # Если нет занятых позиций или позиция свободна, выходим из цикла
-            if (not occupied_positions
-                    or self.position not in occupied_positions):
-                break
+        self.cell = choice(free_cells)
 
     def draw(self):
-        """Отрисовывает яблоко на игровом поле."""
-        self.draw_cell()
+        """Отрисовывает яблоко на игровом поле.
+
+        Returns:
+            pg.Rect: Область экрана, которую нужно обновить
+        """
+        return self.draw_cell()
 
 
 class Snake(GameObject):
-    """Класс для представления змейки в игре."""
+    """Класс для представления змейки в игре.
+
+    Атрибуты position и cell у змейки задают ячейку появления и при движении
+    не меняются: текущие ячейки тела хранятся в positions.
+    """
 
     def __init__(self, position=None, body_color=SNAKE_COLOR):
         """Инициализирует змейку с начальными параметрами."""
@@ -115,18 +279,11 @@ class Snake(GameObject):
         Args:
             next_direction (tuple): Новое направление движения
         """
-        if next_direction:
-            # Проверяем, не является ли новое направление противоположным
-            # текущему
-            opposite_directions = {
-                UP: DOWN,
-                DOWN: UP,
-                LEFT: RIGHT,
-                RIGHT: LEFT
-            }
-
-            if next_direction != opposite_directions.get(self.direction):
-                self.direction = next_direction
+        # Проверяем, не является ли новое направление противоположным
+        # текущему
+        if (next_direction
+                and (self.direction, next_direction) not in BLOCKED_PAIRS):
+            self.direction = next_direction
 
     def get_head_position(self):
         """Возвращает позицию головы змейки.
@@ -134,42 +291,112 @@ class Snake(GameObject):
         Returns:
             tuple: Координаты головы змейки (x, y)
         """
-        return self.positions[0]
+        return CELL_POSITION[self.positions[0]]
 
     def move(self):
         """Перемещает змейку в текущем направлении."""
-        head_x, head_y = self.get_head_position()
-        dir_x, dir_y = self.direction
+        # Локальные имена избавляют от повторного поиска атрибутов
+        positions = self.positions
+        occupied = self.occupied
 
-        new_head = (
-            (head_x + dir_x * GRID_SIZE) % SCREEN_WIDTH,
-            (head_y + dir_y * GRID_SIZE) % SCREEN_HEIGHT
-        )
+        # Следующая ячейка берётся из заранее вычисленной таблицы
+        new_head = NEXT_CELL[self.direction][positions[0]]
 
-        self.positions.insert(0, new_head)
-        self.last = (self.positions.pop()
-                     if len(self.positions) > self.length else None)
+        # Хвост освобождает ячейку до того, как в неё может попасть голова
+        if len(positions) >= self.length:
+            last = positions.pop()
+            occupied[last] = 0
+            self.release_cell(last)
+        else:
+            last = None
+        self.last = last
+
+        # Проверка на столкновение с собой - одно чтение из сетки занятости
+        collided = occupied[new_head] == 1
+        self.collided = collided
+
+        positions.appendleft(new_head)
+        occupied[new_head] = 1
+        if not collided:
+            self.occupy_cell(new_head)
+
+    def occupy_cell(self, cell):
+        """Убирает ячейку из списка свободных за O(1).
+
+        Удаляемая ячейка заменяется последней ячейкой списка, поэтому
+        сдвигать остальные элементы не требуется.
+
+        Args:
+            cell (int): Номер занимаемой ячейки
+        """
+        index = self.free_index[cell]
+        last_cell = self.free_cells.pop()
+        if last_cell != cell:
+            self.free_cells[index] = last_cell
+            self.free_index[last_cell] = index
+
+    def release_cell(self, cell):
+        """Возвращает ячейку в список свободных.
+
+        Args:
+            cell (int): Номер освободившейся ячейки
+        """
+        self.free_index[cell] = len(self.free_cells)
+        self.free_cells.append(cell)
 
     def draw(self):
-        """Отрисовывает змейку на игровом поле."""
-        # Отрисовка тела змейки
-        for position in self.positions[1:]:
-            self.draw_cell(position)
+        """Отрисовывает изменения змейки на игровом поле.
 
-        # Отрисовка головы змейки
-        self.draw_cell(self.get_head_position())
+        За ход меняются только две ячейки: появляется новая голова и
+        затирается старый хвост, поэтому остальное тело не перерисовывается.
+
+        Returns:
+            list: Области экрана, которые нужно обновить
+        """
+        dirty_rects = []
 
         # Затирание последнего сегмента
-        if self.last:
-            last_rect = pg.Rect(self.last, (GRID_SIZE, GRID_SIZE))
-            pg.draw.rect(screen, BOARD_BACKGROUND_COLOR, last_rect)
+        if self.last is not None:
+            dirty_rects.append(self.erase_cell(self.last))
+
+        # Отрисовка головы змейки
+        dirty_rects.append(self.draw_cell(self.positions[0]))
+
+        return dirty_rects
+
+    def erase(self):
+        """Затирает все ячейки змейки, включая ещё не затёртый хвост.
+
+        Returns:
+            list: Области экрана, которые нужно обновить
+        """
+        dirty_rects = [CELL_RECT[cell] for cell in self.positions]
+        if self.last is not None:
+            dirty_rects.append(CELL_RECT[self.last])
+
+        # Все ячейки затираются одним пакетным вызовом
+        screen.blits([(ERASE_TILE, rect) for rect in dirty_rects],
+                     doreturn=False)
+        return dirty_rects
 
     def reset(self):
         """Сбрасывает змейку в начальное состояние."""
         self.length = 1
-        self.positions = [self.position]
+        # Тело змейки хранится как номера ячеек, а не кортежи координат.
+        # Змейка всегда появляется в исходной ячейке self.cell
+        head = self.cell
+        self.positions = deque([head])
+        # Сетка занятости: по байту на ячейку, 1 - ячейка занята телом
+        self.occupied = bytearray(CELL_COUNT)
+        self.occupied[head] = 1
         self.direction = RIGHT
         self.last = None
+        self.collided = False
+
+        # Свободные ячейки поля и их индексы в списке (по номеру ячейки)
+        self.free_cells = list(range(CELL_COUNT))
+        self.free_index = list(range(CELL_COUNT))
+        self.occupy_cell(head)
 
 
 def handle_keys(game_object):
@@ -178,7 +405,7 @@ def handle_keys(game_object):
     Args:
         game_object (Snake): Объект змейки, которым управляет игрок
     """
-    for event in pg.event.get():
+    for event in pg.event.get(HANDLED_EVENTS):
         if event.type == pg.QUIT:
             pg.quit()
             raise SystemExit
@@ -189,16 +416,8 @@ def handle_keys(game_object):
                 pg.quit()
                 raise SystemExit
 
-            # Словарь соответствия клавиш и направлений
-            key_direction_map = {
-                pg.K_UP: UP,
-                pg.K_DOWN: DOWN,
-                pg.K_LEFT: LEFT,
-                pg.K_RIGHT: RIGHT
-            }
-
             # Получаем новое направление из словаря
-            new_direction = key_direction_map.get(event.key)
+            new_direction = KEY_DIRECTION.get(event.key)
 
             # Если клавиша соответствует одному из направлений, обновляем
             if new_direction:
@@ -209,9 +428,13 @@ def main():
     """Основная функция игры, содержащая главный игровой цикл."""
     pg.init()
 
+    # Остальные события отбрасываются SDL, не попадая в очередь
+    pg.event.set_blocked(None)
+    pg.event.set_allowed(HANDLED_EVENTS)
+
     # Создание объектов игры
     snake = Snake()
-    apple = Apple(occupied_positions=snake.positions)
+    apple = Apple(free_cells=snake.free_cells)
 
     # Первоначальная отрисовка фона и объектов
     screen.fill(BOARD_BACKGROUND_COLOR)
@@ -219,43 +442,45 @@ def main():
     snake.draw()
     pg.display.update()
 
-    # Флаг для отслеживания необходимости перерисовки фона
-    need_redraw_background = False
+    # Часто вызываемые в цикле функции сохраняются в локальные имена
+    display_update = pg.display.update
+    snake_move = snake.move
+    snake_draw = snake.draw
 
     while True:
         clock.tick(SPEED)
 
+        # Области экрана, изменившиеся за текущий кадр
+        dirty_rects = []
+
         # Обработка ввода пользователя
         handle_keys(snake)
 
         # Перемещение змейки
-        snake.move()
+        snake_move()
 
-        # Проверка на съедание яблока
-        if snake.get_head_position() == apple.position:
-            snake.length += 1
-            apple.randomize_position(snake.positions)
-            apple.draw()
-
-        # Проверка на столкновение с собой
-        elif snake.get_head_position() in snake.positions[1:]:
-            # Устанавливаем флаг для перерисовки фона
-            need_redraw_background = True
+        # Проверка на столкновение с собой или заполнение всего поля
+        if snake.collided or not snake.free_cells:
+            # Затираем только занятые ячейки вместо заливки всего экрана
+            dirty_rects.extend(snake.erase())
+            dirty_rects.append(apple.erase_cell())
             snake.reset()
-            apple.randomize_position(snake.positions)
-
-        # Перерисовываем фон только при необходимости
-        if need_redraw_background:
-            screen.fill(BOARD_BACKGROUND_COLOR)
-            need_redraw_background = False
-            # Перерисовываем объекты после очистки фона
-            apple.draw()
+            apple.randomize_position(snake.free_cells)
+            dirty_rects.append(apple.draw())
 
         # Отрисовка змейки
-        snake.draw()
+        dirty_rects.extend(snake_draw())
+
+        # Проверка на съедание яблока. Новое яблоко рисуется после змейки:
+        # оно может появиться в ячейке хвоста, которую змейка только что
+        # затёрла
+        if snake.positions[0] == apple.cell:
+            snake.length += 1
+            apple.randomize_position(snake.free_cells)
+            dirty_rects.append(apple.draw())
 
-        # Обновление экрана
-        pg.display.update()
+        # Обновление только изменившихся областей экрана
+        display_update(dirty_rects)
 
 
 if __name__ == '__main__':